@@ -2,30 +2,57 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+import html
+import inspect
 import json
 import os
-from collections import defaultdict
+import pickle
+import textwrap
+from functools import cache, lru_cache, partial
+from importlib import metadata
+from importlib.util import find_spec
 
-# 正确导入plotly并获取版本信息
+# 检查plotly并获取版本信息（只探测不导入，实际导入推迟到首次绘图）
 try:
-    import plotly  # 首先导入plotly主模块
-    import plotly.graph_objects as go
-    import plotly.express as px
-    from plotly.subplots import make_subplots
-
+    PLOTLY_VERSION = metadata.version('plotly')
     PLOTLY_AVAILABLE = True
-    PLOTLY_VERSION = plotly.__version__  # 正确获取版本
-except ImportError:
+except metadata.PackageNotFoundError:
     PLOTLY_AVAILABLE = False
     PLOTLY_VERSION = None
 
-# 检查networkx
+# 检查orjson（可选，加速JSON解析）
 try:
-    import networkx as nx
+    import orjson
 
-    NETWORKX_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    NETWORKX_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# 没有orjson时退回pandas内置的ujson解析器（保留完整浮点精度），再退回标准库
+try:
+    from pandas.io.json import ujson_loads
+
+    _json_loads = partial(ujson_loads, precise_float=True)
+except ImportError:
+    _json_loads = json.loads
+
+# 检查networkx（同样推迟导入）
+NETWORKX_AVAILABLE = find_spec('networkx') is not None
+
+
+@cache
+def _plotly_express():
+    """首次使用时导入plotly.express"""
+    import plotly.express as px
+    return px
+
+
+@cache
+def _networkx():
+    """首次使用时导入networkx"""
+    import networkx as nx
+    return nx
+
 
 # 页面配置
 st.set_page_config(
@@ -36,26 +63,301 @@ st.set_page_config(
 )
 
 
+# 分析数据文件
+DATA_PATH = "output/step3_data.json"
+
+# 关系类型（按类型编号排列）
+RELATION_TYPES = ['家族成員', '僕人', '客人']
+
+# 关系类型配色（各图表共用）
+RELATION_TYPE_COLORS = {
+    '家族成員': '#4ECDC4',
+    '僕人': '#96CEB4',
+    '客人': '#FFE66D'
+}
+
+
+# 缓存数据加载：以文件修改时间作为缓存键，数据文件更新后自动失效
+@st.cache_data(show_spinner=False)
+def _load_step3(path, mtime):
+    """读取step3分析数据"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson不接受NaN/Infinity（json.dump默认会写出），退回标准库解析
+            return json.loads(raw)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    # ujson会把NaN静默解析为None，含NaN/Infinity时直接使用标准库
+    if 'NaN' in text or 'Infinity' in text:
+        return json.loads(text)
+    try:
+        return _json_loads(text)
+    except ValueError:
+        # ujson不支持超出范围的浮点数及超过64位的整数，退回标准库解析
+        return json.loads(text)
+
+
+def _link_key(network):
+    """node-link数据中边列表所用的键（networkx<3.6默认写links，3.6起默认edges）"""
+    return 'links' if 'links' in network else 'edges'
+
+
+@st.cache_resource(show_spinner=False)
+def _build_graph(path, mtime, pickle_path, pickle_mtime):
+    """重建网络（nx.Graph不便序列化，使用cache_resource）
+
+    若存在不早于JSON的预先导出pickle，直接加载，跳过node_link_graph逐边重建；
+    pickle损坏或版本不兼容时退回JSON。
+    """
+    if NETWORKX_AVAILABLE and pickle_mtime is not None and pickle_mtime >= mtime:
+        try:
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+            pass
+
+    data = _load_step3(path, mtime)
+    if not NETWORKX_AVAILABLE or not data.get('network'):
+        return None
+    # 按文件中实际存在的键读取边列表，而不是依赖所装networkx版本的默认键
+    nx = _networkx()
+    network = data['network']
+    params = inspect.signature(nx.node_link_graph).parameters
+    for kw in ('edges', 'link'):  # networkx>=3.4使用edges=，更早版本使用link=
+        if kw in params:
+            return nx.node_link_graph(network, **{kw: _link_key(network)})
+    return nx.node_link_graph(network)
+
+
+@st.cache_data(show_spinner=False)
+def _jiamu_neighbors(path, mtime):
+    """賈母的直接邻居表（角色、关系强度、关系类型），每个数据文件只分类一次
+
+    直接扫描node-link数据中的边，无需重建整个网络。
+    """
+    network = _load_step3(path, mtime).get('network')
+    if not network or not any(node.get('id') == '賈母' for node in network.get('nodes', [])):
+        return None
+
+    # 与nx.node_link_graph保持一致：无向图两端均可匹配，重复边以最后一条为准，
+    # 缺少weight的边按NetworkX的默认权重1计算
+    directed = network.get('directed', False)
+    weights = {}
+    for link in network.get(_link_key(network), []):
+        if link['source'] == '賈母':
+            weights[link['target']] = link.get('weight', 1)
+        elif link['target'] == '賈母' and not directed:
+            weights[link['source']] = link.get('weight', 1)
+
+    df = pd.DataFrame({
+        'character': pd.Series(list(weights), dtype=object),
+        'weight': list(weights.values())
+    })
+
+    # 简单分类（向量化）：分类编码对应RELATION_TYPES
+    conditions = [
+        df['character'].str.contains('賈'),
+        df['character'].str.contains('人|兒')
+    ]
+    codes = np.select(conditions, [0, 1], default=2).astype(np.int8)
+    df['type'] = pd.Categorical.from_codes(codes, categories=RELATION_TYPES)
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _graph_stats(_G, graph_key):
+    """计算网络统计指标（图对象不参与哈希，以数据来源作为缓存键）"""
+    return {
+        'nodes': _G.number_of_nodes(),
+        'edges': _G.number_of_edges(),
+        'density': _networkx().density(_G)
+    }
+
+
+def _file_mtime(path):
+    """文件修改时间，文件不存在时返回None"""
+    return os.path.getmtime(path) if os.path.exists(path) else None
+
+
+@st.cache_data(show_spinner=False)
+def _load_metrics(path, mtime, parquet_path, parquet_mtime):
+    """构建关系指标表（优先读取不早于JSON的预先导出Parquet）"""
+    if parquet_mtime is not None and parquet_mtime >= mtime:
+        try:
+            return pd.read_parquet(parquet_path)
+        except (ImportError, OSError, ValueError):
+            pass  # 缺少pyarrow或文件损坏时退回JSON
+
+    data = _load_step3(path, mtime)
+    if not data.get('df_metrics'):
+        return None
+    return pd.DataFrame(data['df_metrics'])
+
+
+@st.cache_data(show_spinner=False)
+def _jiamu_related(path, mtime, parquet_path, parquet_mtime):
+    """与贾母有关系的角色，按关系强度降序排列（只筛选排序一次）"""
+    df_metrics = _load_metrics(path, mtime, parquet_path, parquet_mtime)
+    if df_metrics is None:
+        return None
+    # 稳定排序：同等关系强度的角色保持原始顺序，排名结果确定
+    related = df_metrics.loc[df_metrics['weight_to_jiamu'] > 0]
+    return related.sort_values(
+        'weight_to_jiamu', ascending=False, kind='mergesort'
+    ).reset_index(drop=True)
+
+
+# 缓存图表对象：输入为可哈希的元组，输入不变时跳过图表构建
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _relationship_bar_fig(characters, weights):
+    """关系强度排名条形图"""
+    df = pd.DataFrame({'character': characters, 'weight_to_jiamu': weights})
+    fig = _plotly_express().bar(
+        df,
+        x='weight_to_jiamu',
+        y='character',
+        orientation='h',
+        title='賈母關係強度排名（前10名）',
+        labels={'weight_to_jiamu': '關係強度', 'character': '角色'}
+    )
+
+    fig.update_layout(height=400)
+    return fig
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _relation_type_pie_fig(types, weights):
+    """关系类型分布饼图"""
+    df = pd.DataFrame({'type': types, 'weight': weights})
+    return _plotly_express().pie(
+        df,
+        values='weight',
+        names='type',
+        color='type',
+        color_discrete_map=RELATION_TYPE_COLORS,
+        title='賈母關係類型分佈'
+    )
+
+
+# 首页与关于页面的静态内容：合并为单个Markdown块，减少页面元素数量
+_HOMEPAGE_FEATURES_MD = """
+### 系統功能
+
+🔍 **人物關係分析**
+- 賈母與各角色的關係強度量化
+- 社交網絡結構可視化
+- 中心性指標計算
+
+📈 **數據可視化**
+- 交互式關係圖表
+- 關係強度排名
+- 網絡統計分析
+
+📊 **統計分析**
+- 網絡密度計算
+- 角色重要性排名
+- 關係類型分佈
+"""
+
+
+@lru_cache(maxsize=1)
+def _about_html():
+    """关于页面的静态内容（项目简介、文件结构、依赖列表）"""
+    file_tree = textwrap.dedent("""\
+        your-repo/
+        ├── requirements.txt          # 依賴列表
+        ├── streamlit_app.py         # 主應用文件
+        ├── output/                  # 數據目錄
+        │   ├── step3_data.json     # 分析數據
+        │   ├── step3_graph.pkl     # 網絡（可選，加速加載）
+        │   └── df_metrics.parquet  # 指標表（可選，加速加載）
+        └── README.md               # 項目說明""")
+
+    requirements = textwrap.dedent("""\
+        streamlit>=1.22.0
+        pandas>=1.5.0
+        networkx>=3.0
+        plotly>=5.0.0
+        numpy>=1.21.0
+        orjson>=3.6.0""")
+
+    return textwrap.dedent("""\
+        ### 項目簡介
+        本系統對《紅樓夢》中賈母的社交網絡進行量化分析。
+
+        ### 技術棧
+        - **Streamlit**: Web應用框架
+        - **Plotly**: 數據可視化
+        - **NetworkX**: 社交網絡分析
+        - **Pandas**: 數據處理
+
+        ### 數據來源
+        - 《紅樓夢》1-40回文本分析
+        - 基於共現關係和對話關係提取
+
+        <details><summary>項目文件結構</summary>
+        <pre><code>{file_tree}</code></pre>
+        </details>
+
+        <details><summary>requirements.txt內容</summary>
+        <pre><code>{requirements}</code></pre>
+        </details>
+        """).format(file_tree=html.escape(file_tree), requirements=html.escape(requirements))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _environment_markdown():
+    """环境检查的库版本列表（运行环境不随重新运行变化，缓存为一个Markdown块）"""
+    libraries = {
+        'streamlit': st.__version__,
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'networkx': '可用' if NETWORKX_AVAILABLE else '不可用',
+        'plotly': PLOTLY_VERSION if PLOTLY_AVAILABLE else '不可用'
+    }
+
+    lines = []
+    for lib, version in libraries.items():
+        if version and version != '不可用':
+            lines.append(f"- ✅ {lib}: {version}")
+        else:
+            lines.append(f"- ❌ {lib}: {version}")
+    return "\n".join(lines)
+
+
 class JiaMuAnalyzer:
     def __init__(self):
         self.data_loaded = False
-        self.data = None
+        self.data_path = None
+        self.data_mtime = None
         self.G = None
+        self.graph_key = None
+        self.jiamu_related = None
+        self.df_neighbors = None
 
     def load_data(self):
         """加载数据"""
         try:
-            data_path = "output/step3_data.json"
+            data_path = DATA_PATH
             if not os.path.exists(data_path):
                 st.warning("数据文件不存在，将使用演示数据")
                 return False
 
-            with open(data_path, 'r', encoding='utf-8') as f:
-                self.data = json.load(f)
-
-            # 重建网络（如果networkx可用）
-            if NETWORKX_AVAILABLE and self.data.get('network'):
-                self.G = nx.node_link_graph(self.data['network'])
+            # 各数据视图均以路径和修改时间为键缓存；网络在需要时才重建。
+            # 不在实例上保留原始JSON，避免每次运行都从缓存复制整份数据
+            mtime = os.path.getmtime(data_path)
+            self.data_path, self.data_mtime = data_path, mtime
+            self.G = None
+            metrics_path = os.path.join(os.path.dirname(data_path), "df_metrics.parquet")
+            metrics_mtime = _file_mtime(metrics_path)
+            self.jiamu_related = _jiamu_related(data_path, mtime, metrics_path, metrics_mtime)
+            self.df_neighbors = None
 
             self.data_loaded = True
             return True
@@ -63,24 +365,42 @@ class JiaMuAnalyzer:
             st.error(f"数据加载失败: {e}")
             return False
 
+    def data_changed(self):
+        """数据文件在上次加载后是否被修改或删除"""
+        return _file_mtime(DATA_PATH) != self.data_mtime
+
+    def get_graph(self):
+        """按需获取网络（已缓存），只有需要全局统计的页面才会重建"""
+        if self.G is None and self.data_loaded:
+            try:
+                graph_path = os.path.join(os.path.dirname(self.data_path), "step3_graph.pkl")
+                self.graph_key = (self.data_path, self.data_mtime, graph_path, _file_mtime(graph_path))
+                self.G = _build_graph(*self.graph_key)
+            except Exception as e:
+                st.error(f"网络构建失败: {e}")
+                self.G = None
+        return self.G
+
+    def get_neighbors(self):
+        """按需获取賈母的邻居表（已缓存），只有网络可视化页面才会计算"""
+        if self.df_neighbors is None and self.data_loaded:
+            try:
+                self.df_neighbors = _jiamu_neighbors(self.data_path, self.data_mtime)
+            except Exception as e:
+                st.error(f"邻居数据构建失败: {e}")
+                self.df_neighbors = None
+        return self.df_neighbors
+
+    def graph_stats(self):
+        """获取网络统计指标（已缓存）"""
+        return _graph_stats(self.G, self.graph_key)
+
     def show_environment_check(self):
         """显示环境检查 - 修复版本"""
         st.sidebar.title("🔧 環境檢查")
 
-        # 修复版本检查代码
-        libraries = {
-            'streamlit': st.__version__,
-            'pandas': pd.__version__,
-            'numpy': np.__version__,
-            'networkx': '可用' if NETWORKX_AVAILABLE else '不可用',
-            'plotly': PLOTLY_VERSION if PLOTLY_AVAILABLE else '不可用'
-        }
-
-        for lib, version in libraries.items():
-            if version and version != '不可用':
-                st.sidebar.success(f"✅ {lib}: {version}")
-            else:
-                st.sidebar.error(f"❌ {lib}: {version}")
+        # 库版本（已缓存）
+        st.sidebar.markdown(_environment_markdown())
 
         # 数据状态
         if self.data_loaded:
@@ -96,34 +416,29 @@ class JiaMuAnalyzer:
             st.info("請先加載數據")
             return
 
-        # 基本统计
+        # 基本统计（仅此页面需要完整网络）：先统一取值，再逐列展示
+        G = self.get_graph()
+        if G:
+            stats = self.graph_stats()
+            n_nodes, n_edges = stats['nodes'], stats['edges']
+            density = f"{stats['density']:.4f}"
+            jiamu_degree = G.degree('賈母') if '賈母' in G else "N/A"
+        else:
+            n_nodes = n_edges = density = jiamu_degree = "N/A"
+
         col1, col2, col3, col4 = st.columns(4)
 
         with col1:
-            if self.G:
-                st.metric("節點數量", self.G.number_of_nodes())
-            else:
-                st.metric("節點數量", "N/A")
+            st.metric("節點數量", n_nodes)
 
         with col2:
-            if self.G:
-                st.metric("邊數量", self.G.number_of_edges())
-            else:
-                st.metric("邊數量", "N/A")
+            st.metric("邊數量", n_edges)
 
         with col3:
-            if self.G:
-                density = nx.density(self.G) if NETWORKX_AVAILABLE else 0
-                st.metric("網絡密度", f"{density:.4f}")
-            else:
-                st.metric("網絡密度", "N/A")
+            st.metric("網絡密度", density)
 
         with col4:
-            if self.G and '賈母' in self.G:
-                degree = self.G.degree('賈母')
-                st.metric("賈母的度", degree)
-            else:
-                st.metric("賈母的度", "N/A")
+            st.metric("賈母的度", jiamu_degree)
 
     def show_relationship_analysis(self):
         """显示关系分析"""
@@ -133,31 +448,21 @@ class JiaMuAnalyzer:
             st.warning("請先加載數據並確保Plotly可用")
             return
 
-        # 获取关系数据
-        df_metrics = pd.DataFrame(self.data['df_metrics']) if self.data.get('df_metrics') else None
+        # 获取与贾母有关系的角色（已在加载时筛选并排序）
+        jiamu_related = self.jiamu_related
 
-        if df_metrics is None:
+        if jiamu_related is None:
             st.warning("無關係數據可用")
             return
 
-        # 筛选与贾母有关系的角色
-        jiamu_related = df_metrics[df_metrics['weight_to_jiamu'] > 0].copy()
-        jiamu_related = jiamu_related.sort_values('weight_to_jiamu', ascending=True)
-
-        # 取前10名
-        top_10 = jiamu_related.head(10)
+        # 取前10名，倒序使最强者显示在条形图顶部
+        top_10 = jiamu_related.head(10).iloc[::-1]
 
         # 创建水平条形图
-        fig = px.bar(
-            top_10,
-            x='weight_to_jiamu',
-            y='character',
-            orientation='h',
-            title='賈母關係強度排名（前10名）',
-            labels={'weight_to_jiamu': '關係強度', 'character': '角色'}
+        fig = _relationship_bar_fig(
+            tuple(top_10['character'].tolist()),
+            tuple(top_10['weight_to_jiamu'].tolist())
         )
-
-        fig.update_layout(height=400)
         st.plotly_chart(fig, use_container_width=True)
 
     def show_simple_network_viz(self):
@@ -168,101 +473,55 @@ class JiaMuAnalyzer:
             st.warning("可視化功能不可用")
             return
 
-        if self.G is None or '賈母' not in self.G:
+        # 获取贾母的邻居（按需计算并缓存）
+        df_neighbors = self.get_neighbors()
+        if df_neighbors is None:
             st.warning("網絡數據不完整")
             return
 
-        # 获取贾母的邻居
-        neighbors = list(self.G.neighbors('賈母'))
-        if not neighbors:
+        if df_neighbors.empty:
             st.warning("賈母沒有直接相連的角色")
             return
 
         # 创建简单的饼图显示关系类型分布
-        neighbor_data = []
-        for neighbor in neighbors:
-            weight = self.G['賈母'][neighbor]['weight']
-            # 简单分类
-            if '賈' in neighbor:
-                char_type = '家族成員'
-            elif '人' in neighbor or '兒' in neighbor:
-                char_type = '僕人'
-            else:
-                char_type = '客人'
-
-            neighbor_data.append({
-                'character': neighbor,
-                'weight': weight,
-                'type': char_type
-            })
-
-        df_neighbors = pd.DataFrame(neighbor_data)
-        type_summary = df_neighbors.groupby('type')['weight'].sum().reset_index()
+        # 按类型编码汇总关系强度（np.bincount单次遍历，免去groupby开销）
+        type_ids = df_neighbors['type'].cat.codes.to_numpy()
+        n_types = len(RELATION_TYPES)
+        totals = np.bincount(type_ids, weights=df_neighbors['weight'].to_numpy(), minlength=n_types)
+        present = np.bincount(type_ids, minlength=n_types) > 0
+        type_summary = pd.DataFrame({'type': RELATION_TYPES, 'weight': totals})[present]
 
         # 创建饼图
-        fig = px.pie(
-            type_summary,
-            values='weight',
-            names='type',
-            title='賈母關係類型分佈'
+        fig = _relation_type_pie_fig(
+            tuple(type_summary['type'].tolist()),
+            tuple(type_summary['weight'].tolist())
         )
 
         st.plotly_chart(fig, use_container_width=True)
 
         # 显示邻居列表
         st.subheader("與賈母直接相連的角色")
-        for i, row in df_neighbors.iterrows():
-            st.write(f"- **{row['character']}** ({row['type']}): 關係強度 {row['weight']}")
+        lines = [
+            f"- **{row.character}** ({row.type}): 關係強度 {row.weight}"
+            for row in df_neighbors.itertuples(index=False)
+        ]
+        st.markdown("\n".join(lines))
 
     def show_about(self):
         """显示关于信息"""
         st.header("ℹ️ 關於項目")
 
-        st.markdown("""
-        ### 項目簡介
-        本系統對《紅樓夢》中賈母的社交網絡進行量化分析。
-
-        ### 技術棧
-        - **Streamlit**: Web應用框架
-        - **Plotly**: 數據可視化
-        - **NetworkX**: 社交網絡分析
-        - **Pandas**: 數據處理
-
-        ### 數據來源
-        - 《紅樓夢》1-40回文本分析
-        - 基於共現關係和對話關係提取
-        """)
-
-        # 显示文件结构
-        with st.expander("項目文件結構"):
-            st.code("""
-            your-repo/
-            ├── requirements.txt          # 依賴列表
-            ├── streamlit_app.py         # 主應用文件
-            ├── output/                  # 數據目錄
-            │   └── step3_data.json     # 分析數據
-            └── README.md               # 項目說明
-            """)
-
-        # 显示requirements.txt内容
-        with st.expander("requirements.txt內容"):
-            st.code("""
-            streamlit>=1.22.0
-            pandas>=1.5.0
-            networkx>=3.0
-            plotly>=5.0.0
-            numpy>=1.21.0
-            """)
+        st.markdown(_about_html(), unsafe_allow_html=True)
 
     def run(self):
         """运行主应用"""
         st.title("📖《紅樓夢》賈母社交網絡分析系統")
         st.markdown("---")
 
-        # 加载数据
-        if not self.data_loaded:
+        # 加载数据（实例在会话内复用，仅在首次运行或数据文件变化时重新加载）
+        if not self.data_loaded or self.data_changed():
             with st.spinner("正在加載數據..."):
-                self.load_data()
+                self.data_loaded = self.load_data()
 
         # 侧边栏导航
         st.sidebar.title("📋 導航選單")
@@ -293,43 +552,18 @@ class JiaMuAnalyzer:
         col1, col2 = st.columns([2, 1])
 
         with col1:
-            st.markdown("""
-            ### 系統功能
-
-            🔍 **人物關係分析**
-            - 賈母與各角色的關係強度量化
-            - 社交網絡結構可視化
-            - 中心性指標計算
-
-            📈 **數據可視化**
-            - 交互式關係圖表
-            - 關係強度排名
-            - 網絡統計分析
-
-            📊 **統計分析**
-            - 網絡密度計算
-            - 角色重要性排名
-            - 關係類型分佈
-            """)
+            st.markdown(_HOMEPAGE_FEATURES_MD)
 
         with col2:
             st.subheader("系統狀態")
 
-            # 状态检查
-            status_items = [
-                ("Python環境", "✅ 正常"),
-                ("數據加載", "✅ 成功" if self.data_loaded else "⚠ 加載中"),
-                ("NetworkX", "✅ 可用" if NETWORKX_AVAILABLE else "❌ 不可用"),
-                ("Plotly", "✅ 可用" if PLOTLY_AVAILABLE else "❌ 不可用")
-            ]
-
-            for item, status in status_items:
-                if status.startswith("✅"):
-                    st.success(f"{item}: {status}")
-                elif status.startswith("⚠"):
-                    st.warning(f"{item}: {status}")
-                else:
-                    st.error(f"{item}: {status}")
+            # 状态检查（合并为一个Markdown列表，状态由图标区分）
+            st.markdown(
+                "- Python環境: ✅ 正常\n"
+                f"- 數據加載: {'✅ 成功' if self.data_loaded else '⚠ 加載中'}\n"
+                f"- NetworkX: {'✅ 可用' if NETWORKX_AVAILABLE else '❌ 不可用'}\n"
+                f"- Plotly: {'✅ 可用' if PLOTLY_AVAILABLE else '❌ 不可用'}"
+            )
 
         # 快速功能入口
         st.markdown("---")
@@ -352,9 +586,14 @@ def main():
     if 'section' not in st.session_state:
         st.session_state.section = "首頁"
 
-    # 创建并运行应用
-    app = JiaMuAnalyzer()
-    app.run()
+    # 创建并运行应用：同一会话内复用实例，避免每次运行都从缓存复制数据。
+    # Streamlit每次运行都会重新执行脚本、重新定义类，无法用isinstance判断，
+    # 改为记录脚本文件的修改时间，脚本更新后才重建实例
+    script_mtime = os.path.getmtime(__file__)
+    if 'app' not in st.session_state or st.session_state.get('app_mtime') != script_mtime:
+        st.session_state.app = JiaMuAnalyzer()
+        st.session_state.app_mtime = script_mtime
+    st.session_state.app.run()
 
 
 if __name__ == "__main__":